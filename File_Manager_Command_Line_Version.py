@@ -1,7 +1,71 @@
+import atexit
+import codecs
+import errno
+import functools
+import io
 import os
+import shlex
 import shutil
+import stat
 import sys
-from datetime import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+try:
+    import readline  # Line editing, history and tab completion where available
+except ImportError:
+    readline = None
+
+
+def enable_windows_colors():
+    """
+    Color codes don't work by default in cmd.exe. Turn on virtual terminal
+    processing for stdout directly, falling back to the 'color' command only
+    when a real console rejects the mode.
+    """
+    if not sys.stdout.isatty():
+        return  # Redirected output: no console to configure
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_uint32()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return  # Not a console (e.g. a pipe or a mintty pty)
+        enable_vt = 0x0004  # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+        if kernel32.SetConsoleMode(handle, mode.value | enable_vt):
+            return
+    except (ImportError, AttributeError, OSError):
+        pass
+    os.system('color')
+
+
+if sys.platform == "win32":
+    enable_windows_colors()
+
+# Use larger chunks for the read/write fallback of shutil's file copies
+shutil.COPY_BUFSIZE = 4 * 1024 * 1024
+
+FEEDBACK_PREFIXES = {
+    "info": "\033[94m[*] ",  # Blue
+    "success": "\033[92m[*] ",  # Green
+    "error": "\033[91m[*] ",  # Red
+    "warning": "\033[93m[*] ",  # Yellow
+}
+FEEDBACK_END = "\033[0m\n"  # End color
+
+
+def prompt_color(code):
+    """
+    Returns the escape sequence for an SGR code (e.g. '91') for use in input()
+    prompts. When input() goes through readline (readline loaded, interactive
+    terminal) it is wrapped in \\001/\\002 so the invisible bytes don't count
+    towards the prompt width.
+    """
+    sequence = f"\033[{code}m"
+    if readline is not None and sys.stdin.isatty() and sys.stdout.isatty():
+        return f"\001{sequence}\002"
+    return sequence
 
 
 def print_feedback(message, level="info"):
@@ -9,29 +73,89 @@ def print_feedback(message, level="info"):
     Provides formatted feedback to the user.
     Levels: 'info' (blue), 'success' (green), 'error' (red), 'warning' (yellow).
     """
-    colors = {
-        "info": "\033[94m",  # Blue
-        "success": "\033[92m",  # Green
-        "error": "\033[91m",  # Red
-        "warning": "\033[93m",  # Yellow
-        "endc": "\033[0m",  # End color
-    }
-    # On Windows, color codes don't work by default in cmd.exe
-    if sys.platform == "win32":
-        os.system('color')  # Enables color support on Windows
-    color = colors.get(level, colors["info"])
-    print(f"{color}[*] {message}{colors['endc']}")
+    prefix = FEEDBACK_PREFIXES.get(level, FEEDBACK_PREFIXES["info"])
+    sys.stdout.write(prefix + message + FEEDBACK_END)
+
 
+SIZE_NAMES = ("B", "KB", "MB", "GB", "TB")
+SIZE_POWERS = tuple(1024 ** i for i in range(len(SIZE_NAMES)))
 
+
+@functools.lru_cache(maxsize=4096)
 def get_human_readable_size(size_bytes):
     """Converts a size in bytes to a human-readable format (KB, MB, GB)."""
     if size_bytes == 0:
         return "0B"
-    size_name = ("B", "KB", "MB", "GB", "TB")
-    i = min(len(size_name) - 1, int(size_bytes.bit_length() / 10))
-    p = 1024 ** i
-    s = round(size_bytes / p, 2)
-    return f"{s} {size_name[i]}"
+    i = min(len(SIZE_NAMES) - 1, size_bytes.bit_length() // 10)
+    return f"{size_bytes / SIZE_POWERS[i]:.2f} {SIZE_NAMES[i]}"
+
+
+@functools.lru_cache(maxsize=4096)
+def format_mtime(seconds):
+    """Formats a whole-second timestamp as local time (YYYY-MM-DD HH:MM:SS)."""
+    return time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(seconds))
+
+
+def write_in_chunks(f, content, chunk_size=64 * 1024):
+    """Encodes text to UTF-8 incrementally and writes it to a binary file."""
+    encoder = codecs.getincrementalencoder('utf-8')()
+    for i in range(0, len(content), chunk_size):
+        f.write(encoder.encode(content[i:i + chunk_size]))
+    f.write(encoder.encode('', final=True))
+
+
+# Content up to this many characters (at most 1 MiB as UTF-8) is written
+# with a single unbuffered os.write instead of through a file object.
+SMALL_WRITE_CHARS = 256 * 1024
+
+
+def write_text(name, content, append=False):
+    """Writes text to a file as UTF-8, truncating it first unless appending."""
+    if len(content) > SMALL_WRITE_CHARS:
+        with open(name, 'ab' if append else 'wb', buffering=1024 * 1024) as f:
+            write_in_chunks(f, content)
+        return
+
+    flags = os.O_WRONLY | os.O_CREAT | (os.O_APPEND if append else os.O_TRUNC)
+    flags |= getattr(os, "O_CLOEXEC", 0) | getattr(os, "O_BINARY", 0)
+    fd = os.open(name, flags, 0o666)
+    try:
+        data = memoryview(content.encode('utf-8'))
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+
+
+LISTING_ROW_FORMAT = "%-10s %-40s %-15s %-20s"  # Type, Name, Size, Modified
+LISTING_BATCH_ROWS = 1000  # Rows per stdout write, so large listings start printing early
+STAT_SLICE = 256  # Entries stat'ed per worker task in large directories
+
+
+def stat_entries(entries):
+    """Returns lstat results for a list of DirEntry objects, None where unreadable."""
+    results = []
+    for entry in entries:
+        try:
+            results.append(entry.stat(follow_symlinks=False))
+        except (FileNotFoundError, PermissionError):
+            results.append(None)
+    return results
+
+
+def iter_entry_stats(entries, workers=8):
+    """
+    Yields (entry, stat_result) pairs in order. Large directories are stat'ed
+    in slices on a thread pool so slow (e.g. network) filesystems overlap
+    their metadata round trips.
+    """
+    if len(entries) <= STAT_SLICE:
+        yield from zip(entries, stat_entries(entries))
+        return
+    slices = [entries[i:i + STAT_SLICE] for i in range(0, len(entries), STAT_SLICE)]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for chunk, stats in zip(slices, executor.map(stat_entries, slices)):
+            yield from zip(chunk, stats)
 
 
 def list_directory_contents(path="."):
@@ -39,32 +163,44 @@ def list_directory_contents(path="."):
     Lists the contents of the specified directory with detailed information.
     """
     try:
-        abs_path = os.path.abspath(path)
+        abs_path = os.getcwd() if path == "." else os.path.abspath(path)
         print_feedback(f"Contents of '{abs_path}'", "info")
         print("-" * 80)
-        print(f"{'Type':<10} {'Name':<40} {'Size':<15} {'Modified':<20}")
+        print(LISTING_ROW_FORMAT % ("Type", "Name", "Size", "Modified"))
         print("-" * 80)
 
-        items = os.listdir(path)
-        if not items:
+        with os.scandir(path) as it:
+            entries = list(it)
+        if not entries:
             print("Directory is empty.")
         else:
-            for item in sorted(items, key=lambda x: x.lower()):
-                item_path = os.path.join(path, item)
-                try:
-                    stat_info = os.stat(item_path)
-                    is_dir = os.path.isdir(item_path)
-
-                    item_type = "Folder" if is_dir else "File"
-                    item_name = item + "/" if is_dir else item
-                    size = get_human_readable_size(stat_info.st_size) if not is_dir else ""
-                    mod_time = datetime.fromtimestamp(stat_info.st_mtime).strftime('%Y-%m-%d %H:%M:%S')
-
-                    print(f"{item_type:<10} {item_name:<40} {size:<15} {mod_time:<20}")
-                except (FileNotFoundError, PermissionError):
-                    # Item might be a broken link or inaccessible, skip it
-                    print_feedback(f"Cannot access: {item_name}", "warning")
+            rows = []
+            inaccessible = []
+            format_row = LISTING_ROW_FORMAT.__mod__
+            entries.sort(key=lambda e: e.name.lower())
+            for entry, stat_info in iter_entry_stats(entries):
+                if stat_info is None:
+                    # Item might have vanished or be inaccessible, skip it
+                    inaccessible.append(entry.name)
                     continue
+                # Derive the type from the single lstat rather than is_dir()
+                is_dir = stat.S_ISDIR(stat_info.st_mode)
+
+                item_type = "Folder" if is_dir else "File"
+                item_name = entry.name + "/" if is_dir else entry.name
+                size = get_human_readable_size(stat_info.st_size) if not is_dir else ""
+                mod_time = format_mtime(stat_info.st_mtime_ns // 1_000_000_000)
+
+                rows.append(format_row((item_type, item_name, size, mod_time)))
+                # Emit the table in batches instead of one print() per row
+                if len(rows) == LISTING_BATCH_ROWS:
+                    sys.stdout.write("\n".join(rows) + "\n")
+                    sys.stdout.flush()
+                    rows.clear()
+            if rows:
+                sys.stdout.write("\n".join(rows) + "\n")
+            for item_name in inaccessible:
+                print_feedback(f"Cannot access: {item_name}", "warning")
         print("-" * 80)
     except FileNotFoundError:
         print_feedback(f"Directory not found: {path}", "error")
@@ -87,10 +223,14 @@ def change_directory(new_path):
 
 def create_directory(name):
     """Creates a new directory."""
+    if os.path.lexists(name):
+        print_feedback(f"Directory '{name}' already exists.", "error")
+        return
+
     try:
         os.mkdir(name)
         print_feedback(f"Directory '{name}' created successfully.", "success")
-    except FileExistsError:
+    except FileExistsError:  # Created by someone else after the check
         print_feedback(f"Directory '{name}' already exists.", "error")
     except PermissionError:
         print_feedback("Permission denied to create directory here.", "error")
@@ -104,9 +244,20 @@ def create_file(name):
         return
 
     try:
-        with open(name, 'a'):
-            os.utime(name, None)
+        try:
+            # A freshly created file already has the current mtime
+            with open(name, 'x'):
+                pass
+        except FileExistsError:
+            if os.path.isfile(name):
+                os.utime(name, None)
+            else:
+                # Directory or dangling symlink: let open() create or reject it
+                with open(name, 'a'):
+                    pass
         print_feedback(f"File '{name}' created successfully.", "success")
+    except IsADirectoryError:
+        print_feedback(f"'{name}' is a directory, not a file.", "error")
     except PermissionError:
         print_feedback("Permission denied to create file here.", "error")
 
@@ -114,10 +265,21 @@ def create_file(name):
 def read_file_contents(name):
     """Reads and displays the content of a text file."""
     try:
-        with open(name, 'r', encoding='utf-8', errors='ignore') as f:
+        with open(name, 'rb') as f:
             print_feedback(f"Contents of '{name}':", "info")
             print("-" * 80)
-            print(f.read())
+            out_buffer = getattr(sys.stdout, "buffer", None)
+            if out_buffer is not None:
+                # Stream the raw bytes to stdout instead of decoding the whole file
+                sys.stdout.flush()
+                shutil.copyfileobj(f, out_buffer, 1024 * 1024)
+                out_buffer.flush()
+            else:
+                # Text-only stdout: decode as UTF-8 (dropping invalid bytes) in chunks
+                text = io.TextIOWrapper(f, encoding='utf-8', errors='ignore')
+                shutil.copyfileobj(text, sys.stdout, 1024 * 1024)
+                text.detach()
+            print()
             print("-" * 80)
     except FileNotFoundError:
         print_feedback(f"File not found: {name}", "error")
@@ -135,8 +297,7 @@ def write_to_file(name, content):
         return
 
     try:
-        with open(name, 'wb') as f:  # Open in binary write mode
-            f.write(content.encode('utf-8'))  # Encode string to bytes
+        write_text(name, content)
         print_feedback(f"Content written to '{name}'.", "success")
     except IsADirectoryError:
         print_feedback(f"Cannot write to a directory: '{name}'.", "error")
@@ -152,8 +313,7 @@ def append_to_file(name, content):
         return
 
     try:
-        with open(name, 'ab') as f:  # Open in binary append mode
-            f.write(content.encode('utf-8'))
+        write_text(name, content, append=True)
         print_feedback(f"Content appended to '{name}'.", "success")
     except FileNotFoundError:
         print_feedback(f"File not found: {name}", "error")
@@ -179,19 +339,53 @@ def clear_file(name):
 def remove_item(name):
     """Removes a file or an empty directory."""
     try:
-        if os.path.isfile(name):
-            os.remove(name)
-            print_feedback(f"File '{name}' removed successfully.", "success")
-        elif os.path.isdir(name):
-            if not os.listdir(name):  # Check if directory is empty
+        st = os.lstat(name)
+        if stat.S_ISDIR(st.st_mode):
+            with os.scandir(name) as it:
+                is_empty = next(it, None) is None
+            if is_empty:
                 os.rmdir(name)
                 print_feedback(f"Empty directory '{name}' removed successfully.", "success")
             else:
                 print_feedback(f"Directory '{name}' is not empty. Use 'rmtree' to delete it.", "warning")
         else:
-            print_feedback(f"Item not found: {name}", "error")
+            os.remove(name)
+            print_feedback(f"File '{name}' removed successfully.", "success")
+    except (FileNotFoundError, NotADirectoryError):  # e.g. 'file.txt/'
+        print_feedback(f"Item not found: {name}", "error")
     except PermissionError:
         print_feedback(f"Permission denied to remove: {name}", "error")
+    except OSError as e:
+        print_feedback(f"Could not remove '{name}': {e}", "error")
+
+
+def remove_items(names):
+    """Removes each of the given files or empty directories."""
+    for name in names:
+        remove_item(name)
+
+
+def parallel_rmtree(path, workers=8, min_subdirs=4):
+    """
+    Removes a directory tree, deleting its top-level subtrees concurrently.
+    Small trees (few subdirectories) go straight to shutil.rmtree.
+    """
+    if os.path.islink(path):
+        return shutil.rmtree(path)  # Let rmtree reject symlinks as usual
+    with os.scandir(path) as it:
+        entries = list(it)
+    subdirs = [e for e in entries if e.is_dir(follow_symlinks=False)]
+    if len(subdirs) <= min_subdirs:
+        return shutil.rmtree(path)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(shutil.rmtree if e.is_dir(follow_symlinks=False) else os.remove, e.path)
+            for e in entries
+        ]
+        for future in as_completed(futures):
+            future.result()  # Re-raise the first failure
+    os.rmdir(path)
 
 
 def remove_directory_tree(name):
@@ -201,10 +395,11 @@ def remove_directory_tree(name):
         return
 
     confirm = input(
-        f"\033[91m[!] Are you sure you want to permanently delete '{name}' and all contents? (y/n): \033[0m").lower()
+        f"{prompt_color('91')}[!] Are you sure you want to permanently delete '{name}' and all contents? "
+        f"(y/n): {prompt_color('0')}").lower()
     if confirm == 'y':
         try:
-            shutil.rmtree(name)
+            parallel_rmtree(name)
             print_feedback(f"Directory tree '{name}' removed successfully.", "success")
         except PermissionError:
             print_feedback(f"Permission denied to remove: {name}", "error")
@@ -212,14 +407,138 @@ def remove_directory_tree(name):
         print_feedback("Deletion cancelled.", "info")
 
 
+def fast_copy(src, dst):
+    """
+    Copies a file's data and metadata. On Linux the data is copied in the
+    kernel with copy_file_range (which can share extents on reflink-capable
+    filesystems), falling back to sendfile and then to shutil.copyfile.
+    """
+    if not hasattr(os, "copy_file_range"):
+        return shutil.copy2(src, dst)
+    if os.path.exists(dst) and os.path.samefile(src, dst):
+        raise shutil.SameFileError(f"{src!r} and {dst!r} are the same file")
+    # Opening a FIFO for reading would block until a writer shows up
+    src_mode = os.stat(src).st_mode
+    if stat.S_ISFIFO(src_mode):
+        raise shutil.SpecialFileError(f"`{src}` is a named pipe")
+    if not stat.S_ISREG(src_mode):
+        raise shutil.SpecialFileError(f"`{src}` is not a regular file")
+
+    fallback_errors = (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP)
+    chunk = 1 << 30
+    copied = False
+    src_fd = os.open(src, os.O_RDONLY)
+    try:
+        dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            try:
+                while os.copy_file_range(src_fd, dst_fd, chunk):
+                    pass
+                copied = True
+            except OSError as e:
+                if e.errno not in fallback_errors or os.lseek(dst_fd, 0, os.SEEK_CUR):
+                    raise
+            if not copied:
+                try:
+                    offset = 0
+                    while True:
+                        sent = os.sendfile(dst_fd, src_fd, offset, chunk)
+                        if not sent:
+                            break
+                        offset += sent
+                    copied = True
+                except OSError as e:
+                    if e.errno not in fallback_errors or offset:
+                        raise
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+
+    if not copied:
+        shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+    return dst
+
+
+def parallel_copytree(src, dst, workers=8):
+    """
+    Copies a directory tree like shutil.copytree, but copies the files
+    concurrently on a thread pool. The directory skeleton is created first.
+    """
+    os.makedirs(dst)
+    dir_pairs = []
+    file_pairs = []
+    errors = []
+
+    def walk_error(err):
+        # Record directories that cannot be scanned instead of skipping them
+        path = err.filename
+        rel = os.path.relpath(path, src)
+        errors.append((path, dst if rel == os.curdir else os.path.join(dst, rel), str(err)))
+
+    for root, dirs, files in os.walk(src, onerror=walk_error, followlinks=True):
+        rel = os.path.relpath(root, src)
+        target_root = dst if rel == os.curdir else os.path.join(dst, rel)
+        dir_pairs.append((root, target_root))
+        for d in dirs:
+            os.makedirs(os.path.join(target_root, d), exist_ok=True)
+        for f in files:
+            file_pairs.append((os.path.join(root, f), os.path.join(target_root, f)))
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(fast_copy, s, d): (s, d) for s, d in file_pairs}
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except OSError as e:
+                s, d = futures[future]
+                errors.append((s, d, str(e)))
+
+    # Directory metadata is applied last so file writes don't bump mtimes
+    for s, d in reversed(dir_pairs):
+        try:
+            shutil.copystat(s, d)
+        except OSError as e:
+            errors.append((s, d, str(e)))
+    if errors:
+        raise shutil.Error(errors)
+    return dst
+
+
+def is_within(path, directory):
+    """
+    Returns True if path is directory itself or lies beneath it. Ancestors
+    are compared by device and inode, so symlinked spellings are caught.
+    """
+    dir_stat = os.stat(directory)
+    current = os.path.realpath(path)
+    while True:
+        try:
+            if os.path.samestat(os.stat(current), dir_stat):
+                return True
+        except OSError:
+            pass  # Not created yet
+        parent = os.path.dirname(current)
+        if parent == current:
+            return False
+        current = parent
+
+
 def copy_item(source, destination):
     """Copies a file or directory."""
     try:
         if os.path.isfile(source):
-            shutil.copy2(source, destination)
+            target = destination
+            if os.path.isdir(target):
+                target = os.path.join(target, os.path.basename(source))
+            fast_copy(source, target)
             print_feedback(f"File '{source}' copied to '{destination}'.", "success")
         elif os.path.isdir(source):
-            shutil.copytree(source, destination)
+            if is_within(destination, source):
+                print_feedback(f"Cannot copy '{source}' into itself.", "error")
+                return
+            parallel_copytree(source, destination)
             print_feedback(f"Directory '{source}' copied to '{destination}'.", "success")
         else:
             print_feedback(f"Source item not found: {source}", "error")
@@ -230,12 +549,87 @@ def copy_item(source, destination):
 def move_item(source, destination):
     """Moves/renames a file or directory."""
     try:
-        shutil.move(source, destination)
+        if os.path.isdir(destination):
+            shutil.move(source, destination)  # Move into the directory
+        else:
+            # A plain rename is a single syscall; only cross-device moves need copying
+            try:
+                os.replace(source, destination)
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+                shutil.move(source, destination)
         print_feedback(f"Moved '{source}' to '{destination}'.", "success")
     except Exception as e:
         print_feedback(f"An error occurred during move: {e}", "error")
 
 
+def split_command(command_input):
+    """
+    Splits a command line into arguments, honouring quotes.
+    Backslashes are kept literally on Windows so paths like C:\\Users work.
+
+    >>> split_command('rm report#2.txt')
+    ['rm', 'report#2.txt']
+    >>> split_command('write notes.md "# Title" issue #5')
+    ['write', 'notes.md', '# Title', 'issue', '#5']
+    """
+    lexer = shlex.shlex(command_input, posix=True)
+    lexer.whitespace_split = True
+    lexer.commenters = ""  # '#' is an ordinary character in file names
+    if sys.platform == "win32":
+        lexer.escape = ""
+    return list(lexer)
+
+
+HISTORY_FILE = os.path.join(os.path.expanduser("~"), ".file_manager_history")
+completion_matches = []
+
+
+def complete_path(text, state):
+    """
+    Readline completer for file and directory names. '~' is not expanded,
+    since the commands themselves take paths literally.
+    """
+    if state == 0:
+        dirname, prefix = os.path.split(text)
+        try:
+            with os.scandir(dirname or ".") as it:
+                completion_matches[:] = sorted(
+                    os.path.join(dirname, entry.name) + ("/" if entry.is_dir() else "")
+                    for entry in it if entry.name.startswith(prefix)
+                )
+        except OSError:
+            completion_matches[:] = []
+    return completion_matches[state] if state < len(completion_matches) else None
+
+
+def setup_readline():
+    """Enables tab completion of paths and loads/saves command history."""
+    if readline is None:
+        return
+    if "libedit" in (readline.__doc__ or ""):
+        readline.parse_and_bind("bind ^I rl_complete")
+    else:
+        readline.parse_and_bind("tab: complete")
+    readline.set_completer_delims(" \t\n\"'")
+    readline.set_completer(complete_path)
+    if not sys.stdin.isatty():
+        return  # Scripted runs don't read or rewrite the history file
+    try:
+        readline.read_history_file(HISTORY_FILE)
+    except OSError:
+        pass
+    readline.set_history_length(1000)
+
+    def save_history():
+        try:
+            readline.write_history_file(HISTORY_FILE)
+        except OSError:
+            pass
+    atexit.register(save_history)
+
+
 def print_help():
     """Prints the help menu."""
     print_feedback("Python File Manager Help", "info")
@@ -248,7 +642,7 @@ def print_help():
         "write <file.ext> \"content\"": "Write content to a file, overwriting it (extension required).",
         "append <file.ext> \"content\"": "Append content to a file (extension required).",
         "clear <file.ext>": "Clear all content from a file.",
-        "rm <name.ext>": "Remove a file or an EMPTY directory.",
+        "rm <name.ext> [...]": "Remove files or EMPTY directories.",
         "rmtree <name>": "DANGEROUS: Recursively delete a directory.",
         "cp <src> <dest>": "Copy a file or directory.",
         "mv <src> <dest>": "Move/Rename a file or directory.",
@@ -259,9 +653,31 @@ def print_help():
         print(f"  \033[92m{cmd:<30}\033[0m{desc}")
 
 
+# Command name -> (handler, min args, max args or None, usage string).
+# Handlers receive the argument list after the command name.
+COMMANDS = {
+    "help": (lambda args: print_help(), 0, None, "help"),
+    "ls": (lambda args: list_directory_contents(args[0] if args else "."), 0, None, "ls [path]"),
+    "cd": (lambda args: change_directory(args[0] if args else os.path.expanduser("~")), 0, None, "cd <path>"),
+    "mkdir": (lambda args: create_directory(args[0]), 1, None, "mkdir <directory_name>"),
+    "touch": (lambda args: create_file(args[0]), 1, None, "touch <file_name.ext>"),
+    "cat": (lambda args: read_file_contents(args[0]), 1, None, "cat <file_name.ext>"),
+    "write": (lambda args: write_to_file(args[0], " ".join(args[1:])), 2, None,
+              "write <file.ext> \"content to write\""),
+    "append": (lambda args: append_to_file(args[0], " ".join(args[1:])), 2, None,
+               "append <file.ext> \"content to append\""),
+    "clear": (lambda args: clear_file(args[0]), 1, None, "clear <file.ext>"),
+    "rm": (remove_items, 1, None, "rm <item_name> [<item_name> ...]"),
+    "rmtree": (lambda args: remove_directory_tree(args[0]), 1, None, "rmtree <directory_name>"),
+    "cp": (lambda args: copy_item(args[0], args[1]), 2, 2, "cp <source> <destination>"),
+    "mv": (lambda args: move_item(args[0], args[1]), 2, 2, "mv <source> <destination>"),
+}
+
+
 def main():
     """The main loop of the file manager."""
     print_feedback("Welcome to the Python File Manager. Type 'help' for commands.", "success")
+    setup_readline()
 
     try:
         os.chdir(os.path.expanduser("~"))
@@ -271,8 +687,11 @@ def main():
     while True:
         current_path = os.getcwd()
         prompt_path = current_path.replace(os.path.expanduser("~"), "~")
+        prompt = (f"{prompt_color('1;34')}{prompt_path}{prompt_color('0')} "
+                  f"{prompt_color('1;32')}$ {prompt_color('0')}")
+        print()
         try:
-            command_input = input(f"\n\033[1;34m{prompt_path}\033[0m \033[1;32m$ \033[0m").strip()
+            command_input = input(prompt).strip()
         except (KeyboardInterrupt, EOFError):
             print("\nExiting.")
             break
@@ -280,75 +699,31 @@ def main():
         if not command_input:
             continue
 
-        parts = command_input.split()
+        try:
+            parts = split_command(command_input)
+        except ValueError as e:
+            print_feedback(f"Could not parse command: {e}", "error")
+            continue
+        if not parts:
+            continue
         command = parts[0].lower()
         args = parts[1:]
 
-        try:
-            if command == "exit":
-                print_feedback("Goodbye!", "info")
-                break
-            elif command == "help":
-                print_help()
-            elif command == "ls":
-                list_directory_contents("." if not args else args[0])
-            elif command == "cd":
-                change_directory(args[0] if args else os.path.expanduser("~"))
-            elif command == "mkdir":
-                if args:
-                    create_directory(args[0])
-                else:
-                    print_feedback("Usage: mkdir <directory_name>", "warning")
-            elif command == "touch":
-                if args:
-                    create_file(args[0])
-                else:
-                    print_feedback("Usage: touch <file_name.ext>", "warning")
-            elif command == "cat":
-                if args:
-                    read_file_contents(args[0])
-                else:
-                    print_feedback("Usage: cat <file_name.ext>", "warning")
-            elif command == "write":
-                if len(args) >= 2:
-                    content_to_write = " ".join(args[1:]).strip('"\'')
-                    write_to_file(args[0], content_to_write)
-                else:
-                    print_feedback("Usage: write <file.ext> \"content to write\"", "warning")
-            elif command == "append":
-                if len(args) >= 2:
-                    content_to_append = " ".join(args[1:]).strip('"\'')
-                    append_to_file(args[0], content_to_append)
-                else:
-                    print_feedback("Usage: append <file.ext> \"content to append\"", "warning")
-            elif command == "clear":
-                if args:
-                    clear_file(args[0])
-                else:
-                    print_feedback("Usage: clear <file.ext>", "warning")
-            elif command == "rm":
-                if args:
-                    remove_item(args[0])
-                else:
-                    print_feedback("Usage: rm <item_name>", "warning")
-            elif command == "rmtree":
-                if args:
-                    remove_directory_tree(args[0])
-                else:
-                    print_feedback("Usage: rmtree <directory_name>", "warning")
-            elif command == "cp":
-                if len(args) == 2:
-                    copy_item(args[0], args[1])
-                else:
-                    print_feedback("Usage: cp <source> <destination>", "warning")
-            elif command == "mv":
-                if len(args) == 2:
-                    move_item(args[0], args[1])
-                else:
-                    print_feedback("Usage: mv <source> <destination>", "warning")
-            else:
-                print_feedback(f"Unknown command: '{command}'. Type 'help'.", "error")
+        if command == "exit":
+            print_feedback("Goodbye!", "info")
+            break
+
+        handler = COMMANDS.get(command)
+        if handler is None:
+            print_feedback(f"Unknown command: '{command}'. Type 'help'.", "error")
+            continue
+        func, min_args, max_args, usage = handler
+        if len(args) < min_args or (max_args is not None and len(args) > max_args):
+            print_feedback(f"Usage: {usage}", "warning")
+            continue
 
+        try:
+            func(args)
         except Exception as e:
             print_feedback(f"An unexpected error occurred: {e}", "error")
 